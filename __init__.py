@@ -35,13 +35,17 @@ from .core import (
     generate_keypair,
     encrypt,
     decrypt,
+    encrypt_bytes,
+    decrypt_bytes,
     sign,
     verify_signature,
+    verify_signatures,
 )
 
 # Utility functions
 from .utils import (
     int_to_bytes,
+    int_to_bytes_fixed,
     bytes_to_int,
     save_key_to_pem,
     load_key_from_pem,
@@ -54,11 +58,15 @@ __all__ = [
     'generate_keypair',
     'encrypt',
     'decrypt',
+    'encrypt_bytes',
+    'decrypt_bytes',
     'sign',
     'verify_signature',
+    'verify_signatures',
     
     # Utilities
     'int_to_bytes',
+    'int_to_bytes_fixed',
     'bytes_to_int',
     'save_key_to_pem',
     'load_key_from_pem',
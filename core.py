@@ -1,48 +1,180 @@
-import random
-from typing import NamedTuple, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 from math import gcd
 from primitives import generate_prime, mod_inverse
 
+try:
+    import gmpy2
+    from gmpy2 import mpz, powmod, gcd
+    # Constant-time modexp for private-key material; only present when
+    # gmpy2 was built against a GMP with mpz_powm_sec
+    powmod_sec = getattr(gmpy2, 'powmod_sec', powmod)
+    _HAVE_GMPY2 = True
+except ImportError:
+    _HAVE_GMPY2 = False
+
 class RSAKey(NamedTuple):
     n: int
     e: int
     d: int
+    # CRT parameters (private keys only)
+    p: Optional[int] = None
+    q: Optional[int] = None
+    dP: Optional[int] = None
+    dQ: Optional[int] = None
+    qInv: Optional[int] = None
+    # Montgomery constants (R^2 mod n and -n^-1 mod 2^64) for modexp
+    # backends that work in 64-bit words
+    r2: Optional[int] = None
+    n_inv: Optional[int] = None
+    # Width of the modulus in bytes, cached for to_bytes calls
+    byte_len: Optional[int] = None
+
+def _mont_constants(n: int) -> Tuple[int, int]:
+    # R = 2^(64 * words(n)); a Montgomery modexp needs R^2 mod n to enter
+    # Montgomery form and -n^-1 mod 2^64 for the per-word reduction.
+    r = 1 << 64 * ((n.bit_length() + 63) // 64)
+    r2 = r * r % n
+    n_inv = pow(-n % (1 << 64), -1, 1 << 64)
+    return r2, n_inv
+
+class MontCtx(NamedTuple):
+    n_bits: int
+    r2: int
+    n_inv: int
+
+@lru_cache(maxsize=64)
+def _mont_ctx(n: int) -> MontCtx:
+    # Per-modulus cache so repeated loads or hand-built keys sharing a
+    # modulus do the Montgomery setup once. A key's n never changes, so
+    # entries only leave via LRU eviction.
+    r2, n_inv = _mont_constants(n)
+    return MontCtx(n_bits=n.bit_length(), r2=r2, n_inv=n_inv)
+
+def _ctx(key: RSAKey) -> MontCtx:
+    # Keys built by generate_keypair/load_key_from_pem carry the
+    # constants already; anything else hits the per-modulus cache.
+    if key.r2 is not None:
+        return MontCtx(n_bits=key.n.bit_length(), r2=key.r2, n_inv=key.n_inv)
+    return _mont_ctx(key.n)
 
 def generate_keypair(bits: int = 1024) -> Tuple[RSAKey, RSAKey]:
-    # Generate two distinct primes
-    p = generate_prime(bits // 2)
-    q = generate_prime(bits // 2)
-    while p == q:
+    # Generate the two primes on separate processes; the searches are
+    # independent, so this halves wall-clock time on a multicore machine
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        fp = ex.submit(generate_prime, bits // 2)
+        fq = ex.submit(generate_prime, bits // 2)
+        p, q = fp.result(), fq.result()
+
+    # Keep the primes far enough apart that Fermat factorization of n is
+    # infeasible (this also covers the old p == q retry)
+    while abs(p - q).bit_length() < bits // 2 - 100:
         q = generate_prime(bits // 2)
 
+    # Do the remaining keygen arithmetic on mpz so GMP picks the
+    # multiplication algorithm (Karatsuba/Toom/FFT) per operand size
+    if _HAVE_GMPY2:
+        p, q = mpz(p), mpz(q)
+
     n = p * q
     phi = (p - 1) * (q - 1)
 
-    # Choose public exponent (e)
-    e = 65537 
-    while gcd(e, phi) != 1:
-        e = random.randrange(3, phi, 2)
+    # Choose public exponent (e); generate_prime rejects primes that are
+    # 1 (mod 65537), so 65537 is always coprime to phi
+    e = 65537
+    assert gcd(e, phi) == 1
 
     # Calculate private exponent (d)
     d = mod_inverse(e, phi)
 
-    public_key = RSAKey(n=n, e=e, d=0)
-    private_key = RSAKey(n=n, e=e, d=d)
+    # CRT parameters for faster private-key operations
+    dP = d % (p - 1)
+    dQ = d % (q - 1)
+    qInv = mod_inverse(q, p)
+
+    # Back to plain ints at the key boundary
+    n, p, q, dP, dQ = int(n), int(p), int(q), int(dP), int(dQ)
+
+    r2, n_inv = _mont_constants(n)
+    byte_len = (n.bit_length() + 7) // 8
+
+    public_key = RSAKey(n=n, e=e, d=0, r2=r2, n_inv=n_inv, byte_len=byte_len)
+    private_key = RSAKey(n=n, e=e, d=d, p=p, q=q, dP=dP, dQ=dQ, qInv=qInv,
+                         r2=r2, n_inv=n_inv, byte_len=byte_len)
 
     return public_key, private_key
 
+def _pub_exp_65537(m: int, n: int) -> int:
+    # e = 65537 = 2^16 + 1: exactly 16 squarings and one multiply,
+    # straight-line with no exponent-bit branching
+    x = m * m % n
+    for _ in range(15):
+        x = x * x % n
+    return x * m % n
+
 def encrypt(message: int, public_key: RSAKey) -> int:
     """Encrypt a message using RSA public key"""
+    if _HAVE_GMPY2:
+        return int(powmod(mpz(message), public_key.e, public_key.n))
+    if public_key.e == 65537:
+        return _pub_exp_65537(message, public_key.n)
     return pow(message, public_key.e, public_key.n)
 
+def _crt_pow(base: int, key: RSAKey) -> int:
+    # Private-key exponentiation via the Chinese Remainder Theorem:
+    # two half-size modexps mod p and q, recombined with qInv.
+    if _HAVE_GMPY2:
+        m1 = int(powmod_sec(mpz(base), key.dP, key.p))
+        m2 = int(powmod_sec(mpz(base), key.dQ, key.q))
+    else:
+        m1 = pow(base, key.dP, key.p)
+        m2 = pow(base, key.dQ, key.q)
+    h = (key.qInv * (m1 - m2)) % key.p
+    return m2 + h * key.q
+
 def decrypt(ciphertext: int, private_key: RSAKey) -> int:
     """Decrypt a message using RSA private key"""
+    if private_key.p is not None:
+        return _crt_pow(ciphertext, private_key)
+    if _HAVE_GMPY2:
+        return int(powmod_sec(mpz(ciphertext), private_key.d, private_key.n))
     return pow(ciphertext, private_key.d, private_key.n)
 
 def sign(message: int, private_key: RSAKey) -> int:
     """Sign a message using RSA private key"""
+    if private_key.p is not None:
+        return _crt_pow(message, private_key)
+    if _HAVE_GMPY2:
+        return int(powmod_sec(mpz(message), private_key.d, private_key.n))
     return pow(message, private_key.d, private_key.n)
 
 def verify_signature(message: int, signature: int, public_key: RSAKey) -> bool:
     """Verify a signature using RSA public key"""
-    return pow(signature, public_key.e, public_key.n) == message
\ No newline at end of file
+    if _HAVE_GMPY2:
+        return powmod(mpz(signature), public_key.e, public_key.n) == mpz(message)
+    if public_key.e == 65537:
+        return _pub_exp_65537(signature, public_key.n) == message
+    return pow(signature, public_key.e, public_key.n) == message
+
+def verify_signatures(pairs: Iterable[Tuple[int, int]],
+                      public_key: RSAKey) -> List[bool]:
+    """Verify (message, signature) pairs, sharing the key setup once"""
+    e, n = public_key.e, public_key.n
+    if _HAVE_GMPY2:
+        n = mpz(n)
+        return [powmod(mpz(sig), e, n) == msg for msg, sig in pairs]
+    if e == 65537:
+        return [_pub_exp_65537(sig, n) == msg for msg, sig in pairs]
+    return [pow(sig, e, n) == msg for msg, sig in pairs]
+
+def encrypt_bytes(message: bytes, public_key: RSAKey) -> bytes:
+    """Encrypt a bytes message using RSA public key"""
+    ciphertext = encrypt(int.from_bytes(message, byteorder='big'), public_key)
+    length = public_key.byte_len or (public_key.n.bit_length() + 7) // 8
+    return ciphertext.to_bytes(length, byteorder='big')
+
+def decrypt_bytes(ciphertext: bytes, private_key: RSAKey) -> bytes:
+    """Decrypt a bytes ciphertext using RSA private key"""
+    message = decrypt(int.from_bytes(ciphertext, byteorder='big'), private_key)
+    return message.to_bytes((message.bit_length() + 7) // 8, byteorder='big')
\ No newline at end of file
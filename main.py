@@ -1,4 +1,5 @@
-from core import generate_keypair, encrypt, decrypt, sign, verify_signature
+from core import (generate_keypair, encrypt_bytes, decrypt_bytes, sign,
+                  verify_signature)
 from utils import int_to_bytes, bytes_to_int, save_key_to_pem, load_key_from_pem
 
 def test_encryption_decryption():
@@ -9,17 +10,15 @@ def test_encryption_decryption():
 
     # Test with a simple message
     original_message = "Hello, RSA!"
-    message_int = bytes_to_int(original_message.encode())
-    
+
     print(f"\nOriginal message: {original_message}")
-    
+
     # Encrypt
-    encrypted = encrypt(message_int, public_key)
-    print(f"Encrypted (int): {encrypted}")
-    
+    encrypted = encrypt_bytes(original_message.encode(), public_key)
+    print(f"Encrypted ({len(encrypted)} bytes): {encrypted.hex()}")
+
     # Decrypt
-    decrypted = decrypt(encrypted, private_key)
-    decrypted_message = int_to_bytes(decrypted).decode()
+    decrypted_message = decrypt_bytes(encrypted, private_key).decode()
     print(f"Decrypted message: {decrypted_message}")
     
     # Verify result
@@ -74,12 +73,10 @@ def test_key_storage():
     
     # Verify loaded keys work
     message = "Test message for loaded keys"
-    message_int = bytes_to_int(message.encode())
-    
+
     # Test encryption with loaded keys
-    encrypted = encrypt(message_int, loaded_public)
-    decrypted = decrypt(encrypted, loaded_private)
-    decrypted_message = int_to_bytes(decrypted).decode()
+    encrypted = encrypt_bytes(message.encode(), loaded_public)
+    decrypted_message = decrypt_bytes(encrypted, loaded_private).decode()
     
     assert message == decrypted_message
     print("✓ Key storage test passed!")
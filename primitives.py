@@ -1,6 +1,53 @@
-import random
+import secrets
 from typing import Tuple
 
+try:
+    import gmpy2
+    _HAVE_GMPY2 = True
+except ImportError:
+    _HAVE_GMPY2 = False
+
+try:
+    import numba
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+if _HAVE_NUMBA:
+    @numba.njit("uint64(uint64, uint64, uint64)", cache=True)
+    def _mulmod_u64(a, b, n):
+        # Add-and-double multiplication mod n; never overflows uint64
+        # as long as n < 2^63 (plain a*b would need 128 bits)
+        result = numba.uint64(0)
+        a %= n
+        while b:
+            if b & 1:
+                result = (result + a) % n
+            a = (a + a) % n
+            b >>= 1
+        return result
+
+    @numba.njit("boolean(uint64, uint64, uint64, uint64)", cache=True)
+    def _mr_witness_u64(n, a, d, r):
+        # One Miller-Rabin witness round, entirely in machine words
+        # (literals cast to uint64 so nothing unifies to a wider type)
+        x = numba.uint64(1)
+        base = a % n
+        while d:
+            if d & 1:
+                x = _mulmod_u64(x, base, n)
+            base = _mulmod_u64(base, base, n)
+            d >>= 1
+        if x == 1 or x == n - 1:
+            return True
+        for _ in range(r - 1):
+            x = _mulmod_u64(x, x, n)
+            if x == n - 1:
+                return True
+        return False
+
+_SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
 def is_prime(n: int, k: int = 5) -> bool:
     # Miller-Rabin primality test
     if n == 2 or n == 3:
@@ -8,41 +55,83 @@ def is_prime(n: int, k: int = 5) -> bool:
     if n < 2 or n % 2 == 0:
         return False
 
+    # Cheap trial division rejects most random odd candidates before any
+    # big-int modexp is attempted
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    if _HAVE_NUMBA and n.bit_length() <= 62:
+        # Machine-word modulus: run the witness loop in native code
+        r, d = 0, n - 1
+        while d % 2 == 0:
+            r += 1
+            d //= 2
+        for _ in range(k):
+            a = 2 + secrets.randbelow(n - 3)
+            if not _mr_witness_u64(n, a, d, r):
+                return False
+        return True
+
+    if _HAVE_GMPY2:
+        # All k witness rounds run inside one C call
+        return bool(gmpy2.is_prime(n, k))
+
     # n-1 as 2^r * d
     r, d = 0, n - 1
     while d % 2 == 0:
         r += 1
         d //= 2
 
-    # Witness loop
+    # Witness loop; n - 1 is hoisted out so the hot squaring loop only
+    # does the multiply, the reduction and one comparison per step
+    n_minus_1 = n - 1
     for _ in range(k):
-        a = random.randrange(2, n - 1)
+        a = 2 + secrets.randbelow(n - 3)
         x = pow(a, d, n)
-        if x == 1 or x == n - 1:
+        if x == 1 or x == n_minus_1:
             continue
         for _ in range(r - 1):
-            x = (x * x) % n
-            if x == n - 1:
+            x = x * x % n
+            if x == n_minus_1:
                 break
         else:
             return False
     return True
 
 def generate_prime(bits: int) -> int:
+    if _HAVE_GMPY2:
+        # Sample an odd candidate with the top bit set and jump to the
+        # next prime in C (trial division + BPSW inside GMP).
+        while True:
+            n = gmpy2.mpz(secrets.randbits(bits))
+            n |= (gmpy2.mpz(1) << bits - 1) | 1
+            p = gmpy2.next_prime(n)
+            # p == 1 (mod 65537) would make e=65537 share a factor with
+            # phi, so reject it here instead of re-drawing e at keygen
+            if p.bit_length() == bits and p % 65537 != 1:
+                return int(p)
     while True:
-        n = random.getrandbits(bits)
+        n = secrets.randbits(bits)
         n |= (1 << bits - 1) | 1
+        if n % 65537 == 1:
+            continue
         if is_prime(n):
             return n
 
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    # Iterative extended Euclidean algorithm: returns (g, x, y) with
+    # a*x + b*y == g. The old recursive form allocated a frame per
+    # quotient step and brushed the default recursion limit at RSA
+    # sizes; mod_inverse below is the faster choice for inverses.
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        q, a, b = a // b, b, a % b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
 def mod_inverse(e: int, phi: int) -> int:
-    def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
-
-    _, d, _ = extended_gcd(e, phi)
-    return d % phi
\ No newline at end of file
+    if _HAVE_GMPY2:
+        return int(gmpy2.invert(e, phi))
+    return pow(e, -1, phi)
\ No newline at end of file
@@ -1,27 +1,47 @@
-from core import RSAKey
+import base64
+from typing import Tuple
+
+from core import RSAKey, _mont_ctx
 
 # Convert integer to bytes
 def int_to_bytes(n: int) -> bytes:
     """Convert integer to bytes"""
     return n.to_bytes((n.bit_length() + 7) // 8, byteorder='big')
 
+# Convert integer to bytes at a fixed width (e.g. key.byte_len)
+def int_to_bytes_fixed(n: int, length: int) -> bytes:
+    """Convert integer to bytes of a known length"""
+    return n.to_bytes(length, byteorder='big')
+
 # Convert bytes to integer
 def bytes_to_int(b: bytes) -> int:
     return int.from_bytes(b, byteorder='big')
 
-# Convert RSA key 
+# Length-prefixed big-endian integer encoding (4-byte length, then value)
+def _emit_int(i: int) -> bytes:
+    b = i.to_bytes((i.bit_length() + 7) // 8 or 1, byteorder='big')
+    return len(b).to_bytes(4, byteorder='big') + b
+
+def _read_int(data: bytes, offset: int) -> Tuple[int, int]:
+    length = int.from_bytes(data[offset:offset + 4], byteorder='big')
+    offset += 4
+    return int.from_bytes(data[offset:offset + length], byteorder='big'), offset + length
+
+# Convert RSA key
 def save_key_to_pem(key: RSAKey, is_private: bool = False) -> str:
     key_type = "RSA PRIVATE KEY" if is_private else "RSA PUBLIC KEY"
-    
-    key_data = f"{key.n},{key.e},{key.d if is_private else 0}"
-    import base64
-    encoded = base64.b64encode(key_data.encode()).decode()
+
+    payload = _emit_int(key.n) + _emit_int(key.e) + _emit_int(key.d if is_private else 0)
+    encoded = base64.b64encode(payload).decode()
     return f"-----BEGIN {key_type}-----\n{encoded}\n-----END {key_type}-----"
 
 # Load RSA key
 def load_key_from_pem(pem_str: str) -> RSAKey:
-    import base64
     lines = pem_str.strip().split('\n')
-    key_data = base64.b64decode(lines[1]).decode()
-    n, e, d = map(int, key_data.split(','))
-    return RSAKey(n=n, e=e, d=d)
\ No newline at end of file
+    payload = base64.b64decode(lines[1])
+    n, offset = _read_int(payload, 0)
+    e, offset = _read_int(payload, offset)
+    d, _ = _read_int(payload, offset)
+    ctx = _mont_ctx(n)
+    return RSAKey(n=n, e=e, d=d, r2=ctx.r2, n_inv=ctx.n_inv,
+                  byte_len=(n.bit_length() + 7) // 8)
\ No newline at end of file